@@ -7,9 +7,11 @@ from typing_extensions import TypedDict
 
 JOB_STATUS_TYPE = Literal["Failed", "Rejected", "Sent", "Accepted", "Completed"]
 
+_IN_PROGRESS_STATUSES: frozenset[str] = frozenset({"Sent", "Accepted"})
+
 
 def is_in_progress(status: JOB_STATUS_TYPE) -> bool:
-    return status in ("Sent", "Accepted")
+    return status in _IN_PROGRESS_STATUSES
 
 
 class JobState(TypedDict, total=False):
@@ -1,10 +1,22 @@
 import abc
 import asyncio
+import atexit
+import functools
+import importlib.util
+import json as stdlib_json
 import logging
+import random
 import time
 import typing
+import uuid
+import weakref
 
 import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS, ExecutorClass  # type: ignore
 from compute_horde.fv_protocol.facilitator_requests import SignedFields, to_json_array
 from compute_horde.signature import Signer, signature_to_headers
@@ -24,38 +36,149 @@ from compute_horde_facilitator_sdk._internal.exceptions import (
 
 BASE_URL = "https://facilitator.computehorde.io/api/v1/"
 
+POLL_INITIAL_DELAY = 0.5
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_DELAY = 30.0
+
+MAX_RETRIES = 3
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+IDEMPOTENCY_KEY_HEADER = "X-Idempotency-Key"
+
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
+REQUEST_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+# HTTP/2 multiplexing requires the optional `h2` package (`compute-horde-facilitator-sdk[http2]`).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(data: JsonValue) -> bytes:
+    """Serialize a request body, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return stdlib_json.dumps(data).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> JsonValue:
+    """Deserialize a response body, preferring orjson when installed."""
+    if orjson is not None:
+        return typing.cast(JsonValue, orjson.loads(data))
+    return typing.cast(JsonValue, stdlib_json.loads(data))
+
+
+class _SharedHTTPTransport(httpx.HTTPTransport):
+    """Transport shared between client instances; per-client close() must not tear down the pool."""
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """Async transport shared between client instances; per-client aclose() must not tear down the pool."""
+
+    async def aclose(self) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_transport() -> _SharedHTTPTransport:
+    transport = _SharedHTTPTransport(limits=CONNECTION_LIMITS, http2=HTTP2_AVAILABLE, retries=MAX_RETRIES)
+    atexit.register(httpx.HTTPTransport.close, transport)
+    return transport
+
+
+_async_transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedAsyncHTTPTransport] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_async_transport() -> _SharedAsyncHTTPTransport | None:
+    # Keep-alive connections are bound to the event loop that opened them, so the shared
+    # pool is cached per running loop - sequential asyncio.run() calls each get a fresh
+    # transport instead of dead connections from a closed loop. Outside a running loop
+    # there is nothing to key on; the client then owns its transport as usual.
+    # The async pools cannot be awaited from atexit; their connections are released with the process.
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    transport = _async_transports.get(loop)
+    if transport is None:
+        transport = _async_transports[loop] = _SharedAsyncHTTPTransport(
+            limits=CONNECTION_LIMITS, http2=HTTP2_AVAILABLE, retries=MAX_RETRIES
+        )
+    return transport
+
+
+def _next_delay(attempt: int) -> float:
+    """
+    Return the jittered exponential backoff delay for the given poll attempt (0-based).
+
+    The jitter desynchronizes concurrent pollers so they don't hit the facilitator in lockstep.
+    """
+    delay: float = min(POLL_MAX_DELAY, POLL_INITIAL_DELAY * POLL_BACKOFF_FACTOR**attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
 HTTPClientType = typing.TypeVar("HTTPClientType", bound=httpx.Client | httpx.AsyncClient)
 HTTPResponseType = typing.TypeVar("HTTPResponseType", bound=httpx.Response | typing.Awaitable[httpx.Response])
 
 
 class FacilitatorClientBase(abc.ABC, typing.Generic[HTTPClientType, HTTPResponseType]):
+    __slots__ = ("base_url", "token", "signer", "share_transport", "_base_headers", "client")
+
     def __init__(
         self,
         token: str,
         base_url: str = BASE_URL,
         signer: Signer | None = None,
+        share_transport: bool = True,
     ):
         self.base_url = base_url
         self.token = token
         self.signer = signer
+        # With share_transport (the default) all client instances reuse one process-wide
+        # connection pool, so constructing a client per operation doesn't defeat keep-alive.
+        self.share_transport = share_transport
+        # Normalized once here so each request reuses the same httpx.Headers object
+        # instead of re-normalizing a fresh dict.
+        self._base_headers = httpx.Headers({"Authorization": f"Token {token}"})
         self.client: HTTPClientType = self._get_client()
 
     @abc.abstractmethod
     def _get_client(self) -> HTTPClientType:
         raise NotImplementedError
 
-    def _prepare_request(
+    def _build_request(
         self,
         method: str,
         url: str,
         *,
         json: JsonValue | None = None,
         params: dict[str, str | int] | None = None,
-    ) -> HTTPResponseType:
-        request = self.client.build_request(method=method, url=url, json=json, params=params)
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Request:
+        """
+        Build the outgoing request, signing it if a signer is configured.
+
+        The body is serialized exactly once, here, and handed to httpx as pre-encoded bytes;
+        the signature covers ``SignedFields`` extracted from the same ``json`` object that
+        produced those wire bytes, so what is signed always matches what the server receives.
+        Note that signing may be CPU-bound (``Signer._sign`` runs blake2b + sr25519).
+        """
+        if json is not None:
+            request_headers = {"Content-Type": "application/json", **(headers or {})}
+            request = self.client.build_request(
+                method=method,
+                url=url,
+                content=_json_dumps(json),
+                params=params,
+                headers=request_headers,
+            )
+        else:
+            request = self.client.build_request(method=method, url=url, params=params, headers=headers)
         if self.signer and json:
             try:
                 signed_fields = SignedFields.from_facilitator_sdk_json(json)
@@ -65,7 +188,25 @@ class FacilitatorClientBase(abc.ABC, typing.Generic[HTTPClientType, HTTPResponse
             except Exception:
                 logger.warning(f"No valid fields to sign in json: {json}")
 
-        return typing.cast(HTTPResponseType, self.client.send(request, follow_redirects=True))
+        return request
+
+    @abc.abstractmethod
+    def _prepare_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: JsonValue | None = None,
+        params: dict[str, str | int] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HTTPResponseType:
+        raise NotImplementedError
+
+    @staticmethod
+    def _can_retry(request: httpx.Request) -> bool:
+        # Non-idempotent requests may only be retried when they carry an idempotency key,
+        # so the facilitator can deduplicate a submission that actually got through.
+        return request.method in IDEMPOTENT_METHODS or IDEMPOTENCY_KEY_HEADER in request.headers
 
     def _require_signer(self):
         if not self.signer:
@@ -76,8 +217,16 @@ class FacilitatorClientBase(abc.ABC, typing.Generic[HTTPClientType, HTTPResponse
     def _get_jobs(self, page: int = 1, page_size: int = 10) -> HTTPResponseType:
         return self._prepare_request("GET", "/jobs/", params={"page": page, "page_size": page_size})
 
-    def _get_job(self, job_uuid: str) -> HTTPResponseType:
-        return self._prepare_request("GET", f"/jobs/{job_uuid}/")
+    def _get_jobs_by_uuids(self, job_uuids: list[str]) -> HTTPResponseType:
+        return self._prepare_request(
+            "GET", "/jobs/", params={"uuid__in": ",".join(job_uuids), "page_size": len(job_uuids)}
+        )
+
+    def _get_job(self, job_uuid: str, wait: int | None = None) -> HTTPResponseType:
+        # `wait` asks the facilitator to hold the request for up to that many seconds
+        # until the job status changes (long poll); servers without support ignore it.
+        params: dict[str, str | int] | None = {"wait": wait} if wait is not None else None
+        return self._prepare_request("GET", f"/jobs/{job_uuid}/", params=params)
 
     def _create_raw_job(
         self,
@@ -91,7 +240,7 @@ class FacilitatorClientBase(abc.ABC, typing.Generic[HTTPClientType, HTTPResponse
             data["uploads"] = to_json_array(uploads)
         if volumes is not None:
             data["volumes"] = to_json_array(volumes)
-        return self._prepare_request("POST", "/job-raw/", json=data)
+        return self._prepare_request("POST", "/job-raw/", json=data, headers={IDEMPOTENCY_KEY_HEADER: uuid.uuid4().hex})
 
     def _create_docker_job(
         self,
@@ -118,7 +267,9 @@ class FacilitatorClientBase(abc.ABC, typing.Generic[HTTPClientType, HTTPResponse
             data["uploads"] = to_json_array(uploads)
         if volumes is not None:
             data["volumes"] = to_json_array(volumes)
-        return self._prepare_request("POST", "/job-docker/", json=data)
+        return self._prepare_request(
+            "POST", "/job-docker/", json=data, headers={IDEMPOTENCY_KEY_HEADER: uuid.uuid4().hex}
+        )
 
     def _submit_job_feedback(
         self,
@@ -136,8 +287,45 @@ class FacilitatorClientBase(abc.ABC, typing.Generic[HTTPClientType, HTTPResponse
 
 
 class FacilitatorClient(FacilitatorClientBase[httpx.Client, httpx.Response]):
+    """
+    Synchronous facilitator API client.
+
+    Each instance holds a single persistent `httpx.Client`, so every call - submissions and
+    polls alike - reuses the same keep-alive connection pool instead of paying a TCP+TLS
+    handshake per request. Use it as a context manager (``with FacilitatorClient(...) as c:``)
+    or call :meth:`close` when done.
+    """
+
+    __slots__ = ()
+
+    def _prepare_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: JsonValue | None = None,
+        params: dict[str, str | int] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        request = self._build_request(method, url, json=json, params=params, headers=headers)
+        response = self.client.send(request, follow_redirects=True)
+        for attempt in range(MAX_RETRIES):
+            if response.status_code not in RETRYABLE_STATUS_CODES or not self._can_retry(request):
+                break
+            logger.info(f"Retrying {request.method} {request.url} after status {response.status_code}")
+            time.sleep(_next_delay(attempt))
+            response = self.client.send(request, follow_redirects=True)
+        return response
+
     def _get_client(self) -> httpx.Client:
-        return httpx.Client(base_url=self.base_url, headers={"Authorization": f"Token {self.token}"})
+        return httpx.Client(
+            base_url=self.base_url,
+            headers=self._base_headers,
+            limits=CONNECTION_LIMITS,
+            timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            transport=_shared_transport() if self.share_transport else None,
+        )
 
     def __enter__(self):
         return self
@@ -150,15 +338,26 @@ class FacilitatorClient(FacilitatorClientBase[httpx.Client, httpx.Response]):
 
     def handle_response(self, response: httpx.Response) -> JsonValue:
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
     def get_jobs(self, page: int = 1, page_size: int = 10) -> JsonValue:
         return self.handle_response(self._get_jobs(page, page_size))
 
-    def get_job(self, job_uuid: str) -> JobState:
-        response = self.handle_response(self._get_job(job_uuid))
+    def get_job(self, job_uuid: str, wait: int | None = None) -> JobState:
+        response = self.handle_response(self._get_job(job_uuid, wait=wait))
         return typing.cast(JobState, response)
 
+    def get_jobs_by_uuids(self, job_uuids: list[str]) -> dict[str, JobState]:
+        """
+        Get the states of multiple jobs with a single request.
+
+        :param job_uuids: The UUIDs of the jobs to fetch.
+        :return: A mapping of job UUID to job state.
+        """
+        response = self.handle_response(self._get_jobs_by_uuids(job_uuids))
+        results = typing.cast(dict[str, list[JobState]], response)["results"]
+        return {job["uuid"]: job for job in results}
+
     def create_raw_job(
         self,
         raw_script: str,
@@ -203,7 +402,7 @@ class FacilitatorClient(FacilitatorClientBase[httpx.Client, httpx.Response]):
         )
         return typing.cast(JobState, response)
 
-    def wait_for_job(self, job_uuid: str, timeout: float = 600) -> JobState:
+    def wait_for_job(self, job_uuid: str, timeout: float = 600, poll_wait: int | None = None) -> JobState:
         """
         Wait for a job to complete.
 
@@ -211,21 +410,65 @@ class FacilitatorClient(FacilitatorClientBase[httpx.Client, httpx.Response]):
 
         :param job_uuid: The UUID of the job to wait for.
         :param timeout: The maximum time in seconds to wait for the job to complete.
+        :param poll_wait: If set, ask the facilitator to hold each poll open for up to this many
+            seconds until the status changes (long poll), instead of sleeping between polls.
+            Keep it below the client read timeout. Servers without long-poll support ignore the
+            hint; when a poll returns well before `poll_wait` elapses, the regular backoff
+            sleep is used for that round so polling never degrades to a busy loop.
         :return: The final state of the job.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
         job = None
-        while not job or time.time() - start_time < timeout:
-            job = self.get_job(job_uuid)
+        attempt = 0
+        while not job or time.monotonic() < deadline:
+            poll_started = time.monotonic()
+            job = self.get_job(job_uuid, wait=poll_wait)
             if not is_in_progress(job["status"]):
                 return job
-            time.sleep(3)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if poll_wait is None or time.monotonic() - poll_started < poll_wait / 2:
+                time.sleep(min(_next_delay(attempt), remaining))
+                attempt += 1
 
         raise FacilitatorClientTimeoutException(
             f"Job {job_uuid} did not complete within {timeout} seconds, last status: {job and job['status']!r}"
         )
 
+    def wait_for_jobs(self, job_uuids: list[str], timeout: float = 600) -> dict[str, JobState]:
+        """
+        Wait for multiple jobs to complete.
+
+        All pending jobs are fetched with a single batched request per tick, sharing one
+        backoff schedule, so waiting on N jobs costs one round trip per poll instead of N.
+
+        :param job_uuids: The UUIDs of the jobs to wait for.
+        :param timeout: The maximum time in seconds to wait for all jobs to complete.
+        :return: A mapping of job UUID to the final state of that job.
+        """
+        deadline = time.monotonic() + timeout
+        finished: dict[str, JobState] = {}
+        pending = list(job_uuids)
+        attempt = 0
+        while pending:
+            requested = set(pending)
+            for job in self.get_jobs_by_uuids(pending).values():
+                # A facilitator that ignores the uuid__in filter returns an unfiltered page -
+                # only record jobs that were actually asked for and keep polling for the rest.
+                if job["uuid"] in requested and not is_in_progress(job["status"]):
+                    finished[job["uuid"]] = job
+            pending = [job_uuid for job_uuid in pending if job_uuid not in finished]
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise FacilitatorClientTimeoutException(f"Jobs {pending} did not complete within {timeout} seconds")
+            time.sleep(min(_next_delay(attempt), remaining))
+            attempt += 1
+        return finished
+
     def submit_job_feedback(
         self,
         job_uuid: str,
@@ -256,13 +499,88 @@ class FacilitatorClient(FacilitatorClientBase[httpx.Client, httpx.Response]):
 
 
 class AsyncFacilitatorClient(FacilitatorClientBase[httpx.AsyncClient, typing.Awaitable[httpx.Response]]):
+    """
+    Asynchronous facilitator API client.
+
+    Each instance holds a single persistent `httpx.AsyncClient`, so concurrent calls share
+    one keep-alive connection pool (multiplexed over HTTP/2 when the `http2` extra is
+    installed). Use it as an async context manager
+    (``async with AsyncFacilitatorClient(...) as c:``) or call :meth:`close` when done.
+    """
+
+    __slots__ = ("_job_cache", "_cache_max_age", "_background_refreshes", "_inflight_jobs", "_request_semaphore")
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = BASE_URL,
+        signer: Signer | None = None,
+        share_transport: bool = True,
+        max_inflight: int = 16,
+    ):
+        super().__init__(token, base_url, signer, share_transport)
+        self._job_cache: dict[str, tuple[float, JobState]] = {}
+        # Largest max_age any caller asked for; 0.0 means no caller opted into caching
+        # and nothing is cached. Also bounds how long stale entries are kept around.
+        self._cache_max_age = 0.0
+        self._background_refreshes: set[asyncio.Task[JobState]] = set()
+        self._inflight_jobs: dict[str, asyncio.Task[JobState]] = {}
+        self._request_semaphore = asyncio.Semaphore(max_inflight)
+
     def _get_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(base_url=self.base_url, headers={"Authorization": f"Token {self.token}"})
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._base_headers,
+            limits=CONNECTION_LIMITS,
+            timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            transport=_shared_async_transport() if self.share_transport else None,
+        )
+
+    def _prepare_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: JsonValue | None = None,
+        params: dict[str, str | int] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> typing.Awaitable[httpx.Response]:
+        return self._bounded_send(method, url, json=json, params=params, headers=headers)
+
+    async def _bounded_send(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: JsonValue | None = None,
+        params: dict[str, str | int] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        # The semaphore caps in-flight requests so an unbounded asyncio.gather of
+        # job submissions doesn't thrash the connection pool or pile up signing work.
+        async with self._request_semaphore:
+            if self.signer and json:
+                # Signing is CPU-bound, so run it in a thread to avoid blocking the
+                # event loop when many signed requests are issued concurrently.
+                request = await asyncio.to_thread(
+                    self._build_request, method, url, json=json, params=params, headers=headers
+                )
+            else:
+                request = self._build_request(method, url, json=json, params=params, headers=headers)
+            response = await self.client.send(request, follow_redirects=True)
+            for attempt in range(MAX_RETRIES):
+                if response.status_code not in RETRYABLE_STATUS_CODES or not self._can_retry(request):
+                    break
+                logger.info(f"Retrying {request.method} {request.url} after status {response.status_code}")
+                await asyncio.sleep(_next_delay(attempt))
+                response = await self.client.send(request, follow_redirects=True)
+            return response
 
     async def handle_response(self, response: typing.Awaitable[httpx.Response]) -> JsonValue:
         awaited_response = await response
         awaited_response.raise_for_status()
-        return awaited_response.json()
+        return _json_loads(awaited_response.content)
 
     async def __aenter__(self):
         return self
@@ -276,9 +594,84 @@ class AsyncFacilitatorClient(FacilitatorClientBase[httpx.AsyncClient, typing.Awa
     async def get_jobs(self, page: int = 1, page_size: int = 10) -> JsonValue:
         return await self.handle_response(self._get_jobs(page=page, page_size=page_size))
 
-    async def get_job(self, job_uuid: str) -> JobState:
-        response = await self.handle_response(self._get_job(job_uuid=job_uuid))
-        return typing.cast(JobState, response)
+    async def get_jobs_by_uuids(self, job_uuids: list[str]) -> dict[str, JobState]:
+        """
+        Get the states of multiple jobs with a single request.
+
+        :param job_uuids: The UUIDs of the jobs to fetch.
+        :return: A mapping of job UUID to job state.
+        """
+        response = await self.handle_response(self._get_jobs_by_uuids(job_uuids))
+        results = typing.cast(dict[str, list[JobState]], response)["results"]
+        return {job["uuid"]: job for job in results}
+
+    async def get_job(self, job_uuid: str, max_age: float = 0.0, wait: int | None = None) -> JobState:
+        """
+        Get the state of a job.
+
+        :param job_uuid: The UUID of the job.
+        :param max_age: When positive, opts this client into caching in-progress job states:
+            a state fetched within the last `max_age` seconds is returned without a new
+            request, and any older cached state - which may be arbitrarily stale - is
+            returned immediately while a refresh is scheduled in the background. Callers
+            that cannot tolerate stale data should keep the default of 0.0, which always
+            fetches fresh and caches nothing.
+        :param wait: If set, ask the facilitator to hold the request for up to this many seconds
+            until the job status changes (long poll); servers without support ignore the hint.
+        :return: The state of the job.
+        """
+        if max_age > 0 and wait is None:
+            self._cache_max_age = max(self._cache_max_age, max_age)
+            cached = self._job_cache.get(job_uuid)
+            if cached is not None:
+                fetched_at, job = cached
+                if time.monotonic() - fetched_at > max_age:
+                    self._schedule_refresh(job_uuid)
+                # Hand out a copy so a caller mutating its result can't corrupt the cache.
+                return typing.cast(JobState, dict(job))
+        return await self._fetch_job(job_uuid, wait=wait)
+
+    async def _fetch_job(self, job_uuid: str, wait: int | None = None) -> JobState:
+        if wait is not None:
+            # Long-poll requests are held by the server - don't coalesce them with instant fetches.
+            return await self._do_fetch_job(job_uuid, wait=wait)
+        # Single-flight: concurrent fetches of the same job coalesce into one request.
+        task = self._inflight_jobs.get(job_uuid)
+        if task is None:
+            task = asyncio.create_task(self._do_fetch_job(job_uuid))
+            self._inflight_jobs[job_uuid] = task
+            task.add_done_callback(lambda _: self._inflight_jobs.pop(job_uuid, None))
+        # Shield the shared task so one cancelled awaiter doesn't cancel the fetch
+        # out from under the others.
+        job = await asyncio.shield(task)
+        # Each awaiter gets its own copy so mutating one result doesn't affect the others.
+        return typing.cast(JobState, dict(job))
+
+    async def _do_fetch_job(self, job_uuid: str, wait: int | None = None) -> JobState:
+        job = typing.cast(JobState, await self.handle_response(self._get_job(job_uuid=job_uuid, wait=wait)))
+        if self._cache_max_age > 0 and "status" in job and is_in_progress(job["status"]):
+            now = time.monotonic()
+            # Store a copy - the fetched instance is returned to the caller, who may mutate it.
+            self._job_cache[job_uuid] = (now, typing.cast(JobState, dict(job)))
+            # Drop entries no caller can use anymore, so jobs that are never fetched
+            # again (e.g. abandoned after a wait_for_job timeout) don't pile up.
+            expiry = 2 * self._cache_max_age
+            for cached_uuid in [u for u, (fetched_at, _) in self._job_cache.items() if now - fetched_at > expiry]:
+                del self._job_cache[cached_uuid]
+        else:
+            # Terminal states are not served from the cache - drop the entry.
+            self._job_cache.pop(job_uuid, None)
+        return job
+
+    def _schedule_refresh(self, job_uuid: str) -> None:
+        task = asyncio.create_task(self._fetch_job(job_uuid))
+        self._background_refreshes.add(task)
+        task.add_done_callback(self._finish_refresh)
+
+    def _finish_refresh(self, task: asyncio.Task[JobState]) -> None:
+        self._background_refreshes.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Background job state refresh failed: {task.exception()!r}")
 
     async def create_raw_job(
         self,
@@ -324,7 +717,7 @@ class AsyncFacilitatorClient(FacilitatorClientBase[httpx.AsyncClient, typing.Awa
         )
         return typing.cast(JobState, response)
 
-    async def wait_for_job(self, job_uuid: str, timeout: float = 600) -> JobState:
+    async def wait_for_job(self, job_uuid: str, timeout: float = 600, poll_wait: int | None = None) -> JobState:
         """
         Wait for a job to complete.
 
@@ -332,19 +725,63 @@ class AsyncFacilitatorClient(FacilitatorClientBase[httpx.AsyncClient, typing.Awa
 
         :param job_uuid: The UUID of the job to wait for.
         :param timeout: The maximum time in seconds to wait for the job to complete.
+        :param poll_wait: If set, ask the facilitator to hold each poll open for up to this many
+            seconds until the status changes (long poll), instead of sleeping between polls.
+            Keep it below the client read timeout. Servers without long-poll support ignore the
+            hint; when a poll returns well before `poll_wait` elapses, the regular backoff
+            sleep is used for that round so polling never degrades to a busy loop.
         :return: The final state of the job.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         job = None
-        while time.time() - start_time < timeout:
-            job = await self.get_job(job_uuid)
+        attempt = 0
+        while not job or time.monotonic() < deadline:
+            poll_started = time.monotonic()
+            job = await self.get_job(job_uuid, wait=poll_wait)
             if not is_in_progress(job["status"]):
                 return job
-            await asyncio.sleep(3)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if poll_wait is None or time.monotonic() - poll_started < poll_wait / 2:
+                await asyncio.sleep(min(_next_delay(attempt), remaining))
+                attempt += 1
         raise FacilitatorClientTimeoutException(
             f"Job {job_uuid} did not complete within {timeout} seconds, last status: {job and job['status']!r}"
         )
 
+    async def wait_for_jobs(self, job_uuids: list[str], timeout: float = 600) -> dict[str, JobState]:
+        """
+        Wait for multiple jobs to complete.
+
+        All pending jobs are fetched with a single batched request per tick, sharing one
+        backoff schedule, so waiting on N jobs costs one round trip per poll instead of N.
+
+        :param job_uuids: The UUIDs of the jobs to wait for.
+        :param timeout: The maximum time in seconds to wait for all jobs to complete.
+        :return: A mapping of job UUID to the final state of that job.
+        """
+        deadline = time.monotonic() + timeout
+        finished: dict[str, JobState] = {}
+        pending = list(job_uuids)
+        attempt = 0
+        while pending:
+            requested = set(pending)
+            for job in (await self.get_jobs_by_uuids(pending)).values():
+                # A facilitator that ignores the uuid__in filter returns an unfiltered page -
+                # only record jobs that were actually asked for and keep polling for the rest.
+                if job["uuid"] in requested and not is_in_progress(job["status"]):
+                    finished[job["uuid"]] = job
+            pending = [job_uuid for job_uuid in pending if job_uuid not in finished]
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise FacilitatorClientTimeoutException(f"Jobs {pending} did not complete within {timeout} seconds")
+            await asyncio.sleep(min(_next_delay(attempt), remaining))
+            attempt += 1
+        return finished
+
     async def submit_job_feedback(
         self,
         job_uuid: str,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from unittest.mock import patch
 
@@ -10,6 +11,15 @@ from freezegun import freeze_time
 pytest.register_assert_rewrite("test.unit")
 
 
+def pytest_asyncio_loop_factories(config, item):
+    # Run the async tests on uvloop when it is installed - lower per-await overhead.
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
 @pytest.fixture
 def homedir(tmp_path_factory):
     yield tmp_path_factory.mktemp("test_homedir")
@@ -26,8 +36,9 @@ def env(homedir, monkeypatch):
     yield os.environ
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bittensor_keypair():
+    # sr25519 key derivation is expensive and the seed never changes - derive once per session.
     return bittensor.Keypair.create_from_seed(b"test" * 8)
 
 
@@ -1,5 +1,10 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
 import json
 
+import orjson
 import pydantic
 import pytest
 import pytest_asyncio
@@ -14,6 +19,7 @@ from compute_horde.base.volume import (
 )
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS, ExecutorClass  # type: ignore
 
+from compute_horde_facilitator_sdk._internal import sdk
 from compute_horde_facilitator_sdk._internal.api_models import Volume
 
 
@@ -51,15 +57,25 @@ def signer(apiver_module, bittensor_wallet):
     return apiver_module.BittensorWalletSigner(bittensor_wallet)
 
 
-@pytest.fixture
-def verifier(apiver_module):
-    return apiver_module.BittensorWalletVerifier()
+# VERIFIERS_REGISTRY.get instantiates a fresh verifier on every lookup - reuse one per signature type.
+@functools.lru_cache(maxsize=8)
+def _verifier_for(apiver_module, signature_type):
+    return apiver_module.VERIFIERS_REGISTRY.get(signature_type)
+
+
+# Bounded so identical requests (e.g. retries resending the same signed request)
+# pay the sr25519 verification cost only once across the session.
+@functools.lru_cache(maxsize=1024)
+def _verify_signed_payload(apiver_module, payload_json, signature_json):
+    signature = apiver_module.Signature.model_validate_json(signature_json)
+    _verifier_for(apiver_module, signature.signature_type).verify(payload_json, signature)
 
 
 @pytest.fixture
-def verified_httpx_mock(httpx_mock, verifier, apiver_module):
+def verified_httpx_mock(httpx_mock, apiver_module):
     yield
 
+    items = []
     for request in httpx_mock.get_requests():
         signature = None
         try:
@@ -67,9 +83,16 @@ def verified_httpx_mock(httpx_mock, verifier, apiver_module):
         except Exception:
             pass
         if signature and request.content:
-            verifier = apiver_module.VERIFIERS_REGISTRY.get(signature.signature_type)
             signed_fields = apiver_module.SignedFields.from_facilitator_sdk_json(json.loads(request.content))
-            verifier.verify(signed_fields.model_dump_json(), signature)
+            items.append((signed_fields.model_dump_json(), signature.model_dump_json()))
+
+    if len(items) > 1:
+        # sr25519 verification happens in the Rust core, so threads can overlap the CPU work
+        # without paying the pickling and spawn cost of a process pool.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            list(executor.map(lambda item: _verify_signed_payload(apiver_module, *item), items))
+    elif items:
+        _verify_signed_payload(apiver_module, *items[0])
 
 
 @pytest.fixture
@@ -83,6 +106,23 @@ async def async_facilitator_client(apiver_module, base_url, token, signer):
         yield client
 
 
+# Runs the same test body against both client flavors - pairs of duplicated
+# sync/async tests would double fixture setup (wallet, signer, httpx_mock) instead.
+@pytest_asyncio.fixture(params=["sync", "async"])
+async def any_facilitator_client(request, apiver_module, base_url, token, signer):
+    if request.param == "sync":
+        yield apiver_module.FacilitatorClient(token, base_url, signer=signer)
+    else:
+        async with apiver_module.AsyncFacilitatorClient(token, base_url, signer=signer) as client:
+            yield client
+
+
+async def _maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
 @pytest.fixture
 def output_uploads():
     return [
@@ -110,27 +150,35 @@ def volumes():
     ]
 
 
-def test_get_jobs(facilitator_client, httpx_mock, verified_httpx_mock):
+def mock_json(httpx_mock, payload):
+    """Register a mocked response with the body serialized once, instead of per add_response call."""
+    httpx_mock.add_response(content=orjson.dumps(payload), headers={"Content-Type": "application/json"})
+
+
+@pytest.mark.asyncio
+async def test_get_jobs(any_facilitator_client, httpx_mock, verified_httpx_mock):
     expected_response = {"results": [{"id": 1, "name": "Job 1"}, {"id": 2, "name": "Job 2"}]}
-    httpx_mock.add_response(json=expected_response)
-    response = facilitator_client.get_jobs()
+    mock_json(httpx_mock, expected_response)
+    response = await _maybe_await(any_facilitator_client.get_jobs())
     assert response == expected_response
 
 
-def test_get_job(facilitator_client, httpx_mock, verified_httpx_mock):
+@pytest.mark.asyncio
+async def test_get_job(any_facilitator_client, httpx_mock, verified_httpx_mock):
     job_uuid = "abc123"
     expected_response = {"id": 1, "name": "Job 1"}
-    httpx_mock.add_response(json=expected_response)
-    response = facilitator_client.get_job(job_uuid)
+    mock_json(httpx_mock, expected_response)
+    response = await _maybe_await(any_facilitator_client.get_job(job_uuid))
     assert response == expected_response
 
 
-def test_create_raw_job(facilitator_client, httpx_mock, verified_httpx_mock):
+@pytest.mark.asyncio
+async def test_create_raw_job(any_facilitator_client, httpx_mock, verified_httpx_mock):
     raw_script = "echo 'Hello, World!'"
     input_url = "https://example.com/input"
     expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = facilitator_client.create_raw_job(raw_script, input_url)
+    mock_json(httpx_mock, expected_response)
+    response = await _maybe_await(any_facilitator_client.create_raw_job(raw_script, input_url))
     assert response == expected_response
 
     request = httpx_mock.get_request()
@@ -141,22 +189,25 @@ def test_create_raw_job(facilitator_client, httpx_mock, verified_httpx_mock):
     )
 
 
-def test_create_docker_job(facilitator_client, httpx_mock, verified_httpx_mock):
+@pytest.mark.asyncio
+async def test_create_docker_job(any_facilitator_client, httpx_mock, verified_httpx_mock):
     docker_image = "my-image"
     args = "--arg1 value1"
     env = {"ENV_VAR": "value"}
     use_gpu = True
     input_url = "https://example.com/input"
     expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = facilitator_client.create_docker_job(
-        executor_class=DEFAULT_EXECUTOR_CLASS,
-        docker_image=docker_image,
-        args=args,
-        env=env,
-        use_gpu=use_gpu,
-        input_url="https://example.com/input",
-        target_validator_hotkey="5Hotkey",
+    mock_json(httpx_mock, expected_response)
+    response = await _maybe_await(
+        any_facilitator_client.create_docker_job(
+            executor_class=DEFAULT_EXECUTOR_CLASS,
+            docker_image=docker_image,
+            args=args,
+            env=env,
+            use_gpu=use_gpu,
+            input_url="https://example.com/input",
+            target_validator_hotkey="5Hotkey",
+        )
     )
     assert response == expected_response
 
@@ -173,12 +224,17 @@ def test_create_docker_job(facilitator_client, httpx_mock, verified_httpx_mock):
     )
 
 
-def test_create_raw_job_uploads_volumes(facilitator_client, httpx_mock, verified_httpx_mock, output_uploads, volumes):
+@pytest.mark.asyncio
+async def test_create_raw_job_uploads_volumes(
+    any_facilitator_client, httpx_mock, verified_httpx_mock, output_uploads, volumes
+):
     raw_script = "echo 'Hello, World!'"
     input_url = "https://example.com/input"
     expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = facilitator_client.create_raw_job(raw_script, input_url, uploads=output_uploads, volumes=volumes)
+    mock_json(httpx_mock, expected_response)
+    response = await _maybe_await(
+        any_facilitator_client.create_raw_job(raw_script, input_url, uploads=output_uploads, volumes=volumes)
+    )
     assert response == expected_response
 
     request = httpx_mock.get_request()
@@ -191,8 +247,9 @@ def test_create_raw_job_uploads_volumes(facilitator_client, httpx_mock, verified
     )
 
 
-def test_create_docker_job_uploads_volumes(
-    facilitator_client, httpx_mock, verified_httpx_mock, output_uploads, volumes
+@pytest.mark.asyncio
+async def test_create_docker_job_uploads_volumes(
+    any_facilitator_client, httpx_mock, verified_httpx_mock, output_uploads, volumes
 ):
     docker_image = "my-image"
     args = "--arg1 value1"
@@ -200,15 +257,16 @@ def test_create_docker_job_uploads_volumes(
     use_gpu = True
     input_url = "https://example.com/input"
     expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
+    mock_json(httpx_mock, expected_response)
 
-    response = facilitator_client.create_docker_job(
-        docker_image, args, env, use_gpu, input_url, uploads=output_uploads, volumes=volumes
+    response = await _maybe_await(
+        any_facilitator_client.create_docker_job(
+            docker_image, args, env, use_gpu, input_url, uploads=output_uploads, volumes=volumes
+        )
     )
     assert response == expected_response
 
     request = httpx_mock.get_request()
-    payload = json.loads(request.content)
     payload = DockerJobPayload.model_validate_json(request.content)
     assert payload == DockerJobPayload(
         docker_image=docker_image,
@@ -224,123 +282,41 @@ def test_create_docker_job_uploads_volumes(
 
 
 @pytest.mark.asyncio
-async def test_async_get_jobs(async_facilitator_client, httpx_mock, verified_httpx_mock):
-    expected_response = {"results": [{"id": 1, "name": "Job 1"}, {"id": 2, "name": "Job 2"}]}
-    httpx_mock.add_response(json=expected_response)
-    response = await async_facilitator_client.get_jobs()
-    assert response == expected_response
-
-
-@pytest.mark.asyncio
-async def test_async_get_job(async_facilitator_client, httpx_mock, verified_httpx_mock):
+async def test_async_get_job__concurrent_calls_coalesced(async_facilitator_client, httpx_mock, verified_httpx_mock):
     job_uuid = "abc123"
-    expected_response = {"id": 1, "name": "Job 1"}
-    httpx_mock.add_response(json=expected_response)
-    response = await async_facilitator_client.get_job(job_uuid)
-    assert response == expected_response
-
-
-@pytest.mark.asyncio
-async def test_async_create_raw_job(async_facilitator_client, httpx_mock, verified_httpx_mock):
-    raw_script = "echo 'Hello, World!'"
-    input_url = "https://example.com/input"
-    expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = await async_facilitator_client.create_raw_job(raw_script, input_url)
-    assert response == expected_response
+    job_state = {"uuid": job_uuid, "status": "Sent"}
+    httpx_mock.add_response(json=job_state)
 
-    request = httpx_mock.get_request()
-    payload = json.loads(request.content)
-    payload = RawJobPayload.model_validate_json(request.content)
-    assert payload == RawJobPayload(
-        raw_script=raw_script,
-        input_url=input_url,
+    results = await asyncio.gather(
+        async_facilitator_client.get_job(job_uuid),
+        async_facilitator_client.get_job(job_uuid),
     )
 
-
-@pytest.mark.asyncio
-async def test_async_create_docker_job(async_facilitator_client, httpx_mock, verified_httpx_mock):
-    executor_class = DEFAULT_EXECUTOR_CLASS
-    docker_image = "my-image"
-    args = "--arg1 value1"
-    env = {"ENV_VAR": "value"}
-    use_gpu = True
-    input_url = "https://example.com/input"
-    expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = await async_facilitator_client.create_docker_job(
-        docker_image, args, env, use_gpu, input_url, executor_class
-    )
-    assert response == expected_response
-
-    request = httpx_mock.get_request()
-    payload = json.loads(request.content)
-    payload = DockerJobPayload.model_validate_json(request.content)
-    assert payload == DockerJobPayload(
-        docker_image=docker_image,
-        args=args,
-        env=env,
-        use_gpu=use_gpu,
-        input_url=input_url,
-        executor_class=DEFAULT_EXECUTOR_CLASS,
-        target_validator_hotkey=None,
-    )
+    assert results == [job_state, job_state]
+    assert results[0] is not results[1]  # each awaiter gets its own copy
+    assert len(httpx_mock.get_requests()) == 1
 
 
 @pytest.mark.asyncio
-async def test_async_create_raw_job_uploads_volumes(
-    async_facilitator_client, httpx_mock, verified_httpx_mock, output_uploads, volumes
-):
-    raw_script = "echo 'Hello, World!'"
-    input_url = "https://example.com/input"
-    expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = await async_facilitator_client.create_raw_job(
-        raw_script, input_url, uploads=output_uploads, volumes=volumes
-    )
-    assert response == expected_response
+async def test_async_get_job__max_age_serves_cached(async_facilitator_client, httpx_mock, verified_httpx_mock):
+    job_uuid = "abc123"
+    job_state = {"uuid": job_uuid, "status": "Sent"}
+    httpx_mock.add_response(json=job_state)
 
-    request = httpx_mock.get_request()
-    payload = json.loads(request.content)
-    payload = RawJobPayload.model_validate_json(request.content)
-    assert payload == RawJobPayload(
-        raw_script=raw_script,
-        input_url=input_url,
-        uploads=output_uploads,
-        volumes=volumes,
-    )
+    assert await async_facilitator_client.get_job(job_uuid, max_age=60) == job_state
+    # Served from the cache - no second response is registered.
+    assert await async_facilitator_client.get_job(job_uuid, max_age=60) == job_state
 
 
 @pytest.mark.asyncio
-async def test_async_create_docker_job_uploads_volumes(
-    async_facilitator_client, httpx_mock, verified_httpx_mock, output_uploads, volumes
-):
-    docker_image = "my-image"
-    args = "--arg1 value1"
-    env = {"ENV_VAR": "value"}
-    use_gpu = True
-    input_url = "https://example.com/input"
-    expected_response = {"id": 1, "status": "queued"}
-    httpx_mock.add_response(json=expected_response)
-    response = await async_facilitator_client.create_docker_job(
-        docker_image, args, env, use_gpu, input_url, uploads=output_uploads, volumes=volumes
-    )
-    assert response == expected_response
+async def test_async_get_job__default_does_not_cache(async_facilitator_client, httpx_mock, verified_httpx_mock):
+    job_uuid = "abc123"
+    job_state = {"uuid": job_uuid, "status": "Sent"}
+    mock_json(httpx_mock, job_state)
 
-    request = httpx_mock.get_request()
-    payload = json.loads(request.content)
-    payload = DockerJobPayload.model_validate_json(request.content)
-    assert payload == DockerJobPayload(
-        docker_image=docker_image,
-        args=args,
-        env=env,
-        use_gpu=use_gpu,
-        input_url=input_url,
-        uploads=output_uploads,
-        volumes=volumes,
-        executor_class=DEFAULT_EXECUTOR_CLASS,
-        target_validator_hotkey=None,
-    )
+    assert await async_facilitator_client.get_job(job_uuid) == job_state
+
+    assert async_facilitator_client._job_cache == {}
 
 
 @pytest.fixture
@@ -406,6 +382,38 @@ def test_wait_for_job__immediate_completion(
     assert result == completed_job_state
 
 
+def test_wait_for_job__backoff(
+    facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock, job_uuid, sent_job_state, completed_job_state
+):
+    # serialize the repeated poll response once and reuse the bytes
+    sent_content = orjson.dumps(sent_job_state)
+    for _ in range(5):
+        httpx_mock.add_response(content=sent_content, headers={"Content-Type": "application/json"})
+    mock_json(httpx_mock, completed_job_state)
+
+    facilitator_client.wait_for_job(job_uuid)
+
+    delays = [call.args[0] for call in sleep_mock.call_args_list]
+    assert len(delays) == 5
+    for attempt, delay in enumerate(delays):
+        expected = min(sdk.POLL_MAX_DELAY, sdk.POLL_INITIAL_DELAY * sdk.POLL_BACKOFF_FACTOR**attempt)
+        assert expected * 0.5 <= delay <= expected * 1.5
+
+
+def test_wait_for_job__long_poll(
+    facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock, job_uuid, sent_job_state, completed_job_state
+):
+    httpx_mock.add_response(json=sent_job_state)
+    httpx_mock.add_response(json=completed_job_state)
+
+    assert facilitator_client.wait_for_job(job_uuid, poll_wait=20) == completed_job_state
+
+    assert all(request.url.params["wait"] == "20" for request in httpx_mock.get_requests())
+    # The mocked response returns instantly, i.e. the server ignored the long-poll hint -
+    # the client must fall back to a backoff sleep instead of busy-looping.
+    sleep_mock.assert_called_once()
+
+
 def test_wait_for_job__timeout(
     apiver_module, facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock, job_uuid, sent_job_state
 ):
@@ -417,6 +425,83 @@ def test_wait_for_job__timeout(
     assert f"Job {job_uuid} did not complete within 0 seconds" in str(exc_info.value)
 
 
+def test_get_job__retries_on_server_error(facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock):
+    job_uuid = "abc123"
+    expected_response = {"uuid": job_uuid, "status": "Completed"}
+    httpx_mock.add_response(status_code=502)
+    mock_json(httpx_mock, expected_response)
+
+    assert facilitator_client.get_job(job_uuid) == expected_response
+
+
+def test_create_raw_job__retries_with_idempotency_key(facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock):
+    expected_response = {"id": 1, "status": "queued"}
+    httpx_mock.add_response(status_code=503)
+    mock_json(httpx_mock, expected_response)
+
+    response = facilitator_client.create_raw_job("echo 'Hello, World!'")
+    assert response == expected_response
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    keys = {request.headers["X-Idempotency-Key"] for request in requests}
+    assert len(keys) == 1  # the retry reuses the same idempotency key
+
+
+def test_wait_for_jobs(facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock):
+    httpx_mock.add_response(
+        json={"results": [{"uuid": "job-1", "status": "Sent"}, {"uuid": "job-2", "status": "Failed"}]}
+    )
+    httpx_mock.add_response(json={"results": [{"uuid": "job-1", "status": "Completed"}]})
+
+    result = facilitator_client.wait_for_jobs(["job-1", "job-2"])
+
+    assert result == {
+        "job-1": {"uuid": "job-1", "status": "Completed"},
+        "job-2": {"uuid": "job-2", "status": "Failed"},
+    }
+    # each tick batch-fetches all pending jobs with a single request
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert requests[0].url.params["uuid__in"] == "job-1,job-2"
+    assert requests[1].url.params["uuid__in"] == "job-1"
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_jobs(async_facilitator_client, httpx_mock, verified_httpx_mock, async_sleep_mock):
+    httpx_mock.add_response(
+        json={"results": [{"uuid": "job-1", "status": "Sent"}, {"uuid": "job-2", "status": "Failed"}]}
+    )
+    httpx_mock.add_response(json={"results": [{"uuid": "job-1", "status": "Completed"}]})
+
+    result = await async_facilitator_client.wait_for_jobs(["job-1", "job-2"])
+
+    assert result == {
+        "job-1": {"uuid": "job-1", "status": "Completed"},
+        "job-2": {"uuid": "job-2", "status": "Failed"},
+    }
+
+
+def test_wait_for_jobs__ignores_unrequested_jobs(facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock):
+    # A facilitator without uuid__in support returns an unfiltered page; those
+    # jobs must not leak into the result - polling continues for the requested one.
+    httpx_mock.add_response(
+        json={"results": [{"uuid": "foreign-job", "status": "Completed"}, {"uuid": "job-1", "status": "Sent"}]}
+    )
+    httpx_mock.add_response(json={"results": [{"uuid": "job-1", "status": "Completed"}]})
+
+    result = facilitator_client.wait_for_jobs(["job-1"])
+
+    assert result == {"job-1": {"uuid": "job-1", "status": "Completed"}}
+
+
+def test_wait_for_jobs__timeout(apiver_module, facilitator_client, httpx_mock, verified_httpx_mock, sleep_mock):
+    httpx_mock.add_response(json={"results": [{"uuid": "job-1", "status": "Sent"}]})
+
+    with pytest.raises(apiver_module.FacilitatorClientTimeoutException):
+        facilitator_client.wait_for_jobs(["job-1"], timeout=0)
+
+
 def test_submit_job_feedback(facilitator_client, httpx_mock, verified_httpx_mock):
     job_uuid = "abc123"
     feedback = {"result_correctness": 0.9, "expected_duration": 10.0}